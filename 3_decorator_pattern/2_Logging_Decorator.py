@@ -10,11 +10,12 @@ Implement the Decorator pattern to dynamically add:
 
 Each feature should be implemented as a separate decorator class that wraps a DataProcessor object. The decorators must be stackable in any order without modifying the original DataProcessor class.
 """
-from datetime import datetime
 import time
 from abc import ABC, abstractmethod
+from functools import wraps
 
 class IDataProcessor(ABC):
+    __slots__ = ()
 
     @abstractmethod
     def process(self, data):
@@ -30,103 +31,145 @@ class DataProcessor(IDataProcessor):
             raise Exception("data is not divisible by 2")
 
 
-class ILoggingDecorator(IDataProcessor):
+class LoggingDecorator(IDataProcessor):
+    __slots__ = ("data_processor", "_process")
 
-    @abstractmethod
     def __init__(self, data_processor):
-        pass
-    
-    @abstractmethod
-    def process(self, data):
-        pass
+        self.data_processor = data_processor
+        self._process = data_processor.process
 
 
-class ExecutionTimeDecorator(ILoggingDecorator):
+class ExecutionTimeDecorator(LoggingDecorator):
+    __slots__ = ()
 
-    def __init__(self, data_processor):
-        self.data_processor = data_processor
-    
     def process(self, data):
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         try:
-            return self.data_processor.process(data)
+            return self._process(data)
         finally:
-            end = time.perf_counter()
-            print(f"Execution Time: {end - start:.4f}s")
+            elapsed_ns = time.perf_counter_ns() - start
+            print(f"Execution Time: {elapsed_ns / 1e9:.4f}s")
 
 
-class IOLoggingDecorator(ILoggingDecorator):
+class IOLoggingDecorator(LoggingDecorator):
+    __slots__ = ()
 
-    def __init__(self, data_processor):
-        self.data_processor = data_processor
-    
     def process(self, data):
         print(f"Input: {data}")
-        result = self.data_processor.process(data)
+        result = self._process(data)
         print(f"Ouput: {result}")
         return result
 
 
-class ExceptionLoggingDecorator(ILoggingDecorator):
+class ExceptionLoggingDecorator(LoggingDecorator):
+    __slots__ = ()
 
-    def __init__(self, data_processor):
-        self.data_processor = data_processor
-    
     def process(self, data):
         try:
-            result = self.data_processor.process(data)
+            result = self._process(data)
             return result
         except Exception as e:
             print(f"Exception Occured: {e}")
             raise
 
 
+def _with_execution_time(process):
+    @wraps(process)
+    def timed(data):
+        start = time.perf_counter_ns()
+        try:
+            return process(data)
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start
+            print(f"Execution Time: {elapsed_ns / 1e9:.4f}s")
+    return timed
+
+
+def _with_io_logging(process):
+    @wraps(process)
+    def io_logged(data):
+        print(f"Input: {data}")
+        result = process(data)
+        print(f"Ouput: {result}")
+        return result
+    return io_logged
+
+
+def _with_exception_logging(process):
+    @wraps(process)
+    def exception_logged(data):
+        try:
+            return process(data)
+        except Exception as e:
+            print(f"Exception Occured: {e}")
+            raise
+    return exception_logged
+
+
+def build_processor(data_processor, *, execution_time=False, io_logging=False, exception_logging=False):
+    """
+    Build a process function with only the enabled features wrapped around it.
+
+    Behaves like ExceptionLoggingDecorator(IOLoggingDecorator(ExecutionTimeDecorator(data_processor)))
+    restricted to the enabled features. The features are chosen once here, so calls do no flag checks
+    and disabled features add no wrapper at all.
+    """
+    process = data_processor.process
+    if execution_time:
+        process = _with_execution_time(process)
+    if io_logging:
+        process = _with_io_logging(process)
+    if exception_logging:
+        process = _with_exception_logging(process)
+    return process
+
+
 ## Runner Code
-print("=="*5, "Normal Data Processor", "=="*5)
-data_processor = DataProcessor()
-print(data_processor.process(2))
-try:
-    print(data_processor.process(3))
-except:
-    pass
-
-print("=="*5, "Execution Time Processor", "=="*5)
-execution_time_processor = ExecutionTimeDecorator(data_processor)
-print(execution_time_processor.process(2))
-try:
-    print(execution_time_processor.process(3))
-except:
-    pass
-
-print("=="*5, "Exception Logging Processor", "=="*5)
-exception_logging_processor = ExceptionLoggingDecorator(data_processor)
-print(exception_logging_processor.process(2))
-try:
-    print(exception_logging_processor.process(3))
-except:
-    pass
-
-print("=="*5, "IO Logging Processor", "=="*5)
-io_logging_processor = IOLoggingDecorator(data_processor)
-print(io_logging_processor.process(2))
-try:
-    print(io_logging_processor.process(3))
-except:
-    pass
-
-print("=="*5, "Stacked Processor", "=="*5)
-stacked_processor = ExceptionLoggingDecorator(IOLoggingDecorator(ExecutionTimeDecorator(data_processor)))
-print(stacked_processor.process(2))
-try:
-    print(stacked_processor.process(3))
-except:
-    pass
-
-
-
-
-
-    
-
-    
+if __name__ == "__main__":
+    print("=="*5, "Normal Data Processor", "=="*5)
+    data_processor = DataProcessor()
+    print(data_processor.process(2))
+    try:
+        print(data_processor.process(3))
+    except:
+        pass
+
+    print("=="*5, "Execution Time Processor", "=="*5)
+    execution_time_processor = ExecutionTimeDecorator(data_processor)
+    print(execution_time_processor.process(2))
+    try:
+        print(execution_time_processor.process(3))
+    except:
+        pass
+
+    print("=="*5, "Exception Logging Processor", "=="*5)
+    exception_logging_processor = ExceptionLoggingDecorator(data_processor)
+    print(exception_logging_processor.process(2))
+    try:
+        print(exception_logging_processor.process(3))
+    except:
+        pass
 
+    print("=="*5, "IO Logging Processor", "=="*5)
+    io_logging_processor = IOLoggingDecorator(data_processor)
+    print(io_logging_processor.process(2))
+    try:
+        print(io_logging_processor.process(3))
+    except:
+        pass
+
+    print("=="*5, "Stacked Processor", "=="*5)
+    stacked_processor = ExceptionLoggingDecorator(IOLoggingDecorator(ExecutionTimeDecorator(data_processor)))
+    print(stacked_processor.process(2))
+    try:
+        print(stacked_processor.process(3))
+    except:
+        pass
+
+    print("=="*5, "Built Processor", "=="*5)
+    built_process = build_processor(data_processor, execution_time=True, io_logging=True, exception_logging=True)
+    print(built_process(2))
+    try:
+        print(built_process(3))
+    except:
+        pass
@@ -1,5 +1,12 @@
+from __future__ import annotations
+
+import sys
 from abc import ABC, abstractmethod
 
+_PAYMENT_OK = "Payment successful\n"
+_PAYMENT_FAILED = "Payment failed\n"
+
+
 class IPaymentProcessor(ABC):
     @abstractmethod
     def pay(self, amount: float) -> bool:
@@ -12,10 +19,17 @@ class CheckoutService:
 
     def checkout(self, amount: float) -> None:
         success = self.payment_processor.pay(amount)
-        if success:
-            print("Payment successful")
-        else:
-            print("Payment failed")
+        sys.stdout.write(_PAYMENT_OK if success else _PAYMENT_FAILED)
+
+    # Checks out each amount in order, reporting each result like checkout().
+    def checkout_batch(self, amounts) -> list[bool]:
+        pay = self.payment_processor.pay
+        results = []
+        for amount in amounts:
+            success = pay(amount)
+            sys.stdout.write(_PAYMENT_OK if success else _PAYMENT_FAILED)
+            results.append(success)
+        return results
 
 
 class LegacyBankAPI:
@@ -48,37 +62,48 @@ class WalletAPI:
 
 
 class BankPaymentAdapter(IPaymentProcessor):
+    # Mirrors LegacyBankAPI's limit so payments it would decline skip the API call
+    MAX_CENTS = 100_000
+    __slots__ = ("payment_processor",)
 
     def __init__(self, payment_processor: LegacyBankAPI):
         self.payment_processor = payment_processor
     
     def pay(self, amount: float) -> bool:
         cents = int(round(amount * 100))
+        if cents <= 0 or cents > self.MAX_CENTS:
+            return False
         result = self.payment_processor.make_payment(cents)
         return result == "OK"
 
 
 class WalletPaymentAdapter(IPaymentProcessor):
+    # Mirrors WalletAPI's rules so payments it would reject skip the API call
+    SUPPORTED_CURRENCIES = frozenset({"USD"})
+    MAX_AMOUNT = 5000
+    SUCCESS_STATUSES = frozenset({"success"})
+    __slots__ = ("payment_processor", "currency")
 
     def __init__(self, payment_processor: WalletAPI, currency: str = "USD"):
         self.payment_processor = payment_processor
         self.currency = currency
     
     def pay(self, amount: float) -> bool:
+        if amount <= 0 or amount > self.MAX_AMOUNT or self.currency not in self.SUPPORTED_CURRENCIES:
+            return False
         result = self.payment_processor.send_money(amount, self.currency)
-        return result.get("status") == "success"
-
-
-bank_api = LegacyBankAPI()
-bank_adapter = BankPaymentAdapter(bank_api)
+        return result.get("status") in self.SUCCESS_STATUSES
 
-wallet_api = WalletAPI()
-wallet_adapter = WalletPaymentAdapter(wallet_api)
 
-checkout1 = CheckoutService(bank_adapter)
-checkout2 = CheckoutService(wallet_adapter)
+if __name__ == "__main__":
+    bank_api = LegacyBankAPI()
+    bank_adapter = BankPaymentAdapter(bank_api)
 
-checkout1.checkout(19.99)
-checkout2.checkout(49.99)
+    wallet_api = WalletAPI()
+    wallet_adapter = WalletPaymentAdapter(wallet_api)
 
+    checkout1 = CheckoutService(bank_adapter)
+    checkout2 = CheckoutService(wallet_adapter)
 
+    checkout1.checkout(19.99)
+    checkout2.checkout(49.99)
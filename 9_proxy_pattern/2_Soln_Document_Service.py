@@ -1,7 +1,16 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import logging
+import threading
 import time
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Shared by SecureDocumentProxy and LoggingDocumentProxy so the denial check compares the same object
+_ACCESS_DENIED = "ACCESS DENIED"
+
 class Document(ABC):
     @abstractmethod
     def read(self) -> str:
@@ -18,38 +27,72 @@ class RealDocument(Document):
         return self.content
 
 
+# Loads are memoized so proxies for the same document share one RealDocument
+@lru_cache(maxsize=128)
+def _load_real(document_name: str, content: str) -> RealDocument:
+    return RealDocument(document_name, content)
+
+
+# Background pool for VirtualDocumentProxy.prefetch so several loads can overlap
+_LOADER = ThreadPoolExecutor(max_workers=8)
+
+
 class VirtualDocumentProxy(Document):
+    __slots__ = ("document_name", "content", "document", "_lock", "_pending")
+
     def __init__(self, document_name: str, content: str):
         self.document_name = document_name
         self.content = content
         self.document = None
+        self._lock = threading.Lock()
+        self._pending = None
+
+    # Opt-in: start loading in the background so a later read() waits less
+    def prefetch(self) -> None:
+        with self._lock:
+            if self.document is None and self._pending is None:
+                self._pending = _LOADER.submit(_load_real, self.document_name, self.content)
     
     def read(self):
-        if not self.document:
-            self.document = RealDocument(self.document_name, self.content)
+        # Double-checked so concurrent first reads load the document only once
+        if self.document is None:
+            with self._lock:
+                if self.document is None:
+                    if self._pending is not None:
+                        # Detached first so a failed prefetch falls back to a lazy load next time
+                        pending, self._pending = self._pending, None
+                        self.document = pending.result()
+                    else:
+                        self.document = _load_real(self.document_name, self.content)
         return self.document.read()
 
 
 class SecureDocumentProxy(Document):
+    ALLOWED_ROLES = frozenset({"ADMIN"})
+    __slots__ = ("document", "user_role")
+
     def __init__(self,document:Document, user_role:str):
         self.document = document
         self.user_role = user_role
     
     def read(self):
-        if self.user_role != "ADMIN":
-            return "ACCESS DENIED"
+        if self.user_role not in self.ALLOWED_ROLES:
+            return _ACCESS_DENIED
         return self.document.read()
 
 
 class LoggingDocumentProxy(Document):
+    __slots__ = ("document",)
+
     def __init__(self,document:Document):
         self.document = document
     
     def read(self):
         try:
             content = self.document.read()
-            if content != "ACCESS DENIED":
-                print(f"Document accessed at {datetime.now()}")
+            # Guarded so the timestamp is only built when INFO records are emitted
+            if content != _ACCESS_DENIED and logger.isEnabledFor(logging.INFO):
+                logger.info("Document accessed at %s", datetime.now().isoformat())
             return content
         except Exception as e:
             raise
@@ -1,5 +1,15 @@
+import re
+import sys
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Matches "fail" in any case without allocating a lowercased copy of the message
+_FAIL_RE = re.compile(r"fail", re.IGNORECASE | re.ASCII)
+
+_NOTIFY_OK = "Notification sent\n"
+_NOTIFY_FAILED = "Notification failed\n"
+
 
 class INotifier(ABC):
     @abstractmethod
@@ -14,10 +24,12 @@ class NotificationService:
 
     def notify(self, recipient: str, message: str) -> None:
         success = self.notifier.send(recipient, message)
-        if success:
-            print("Notification sent")
-        else:
-            print("Notification failed")
+        sys.stdout.write(_NOTIFY_OK if success else _NOTIFY_FAILED)
+
+    # Sends to many recipients concurrently; the notifier must be thread-safe.
+    def notify_many(self, recipients_messages, max_workers: int = 16) -> list:
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(lambda rm: self.notifier.send(*rm), recipients_messages))
 
 
 class LegacyEmailSDK:
@@ -30,7 +42,7 @@ class LegacyEmailSDK:
         if len(body) == 0:
             return 400
 
-        if "fail" in body.lower():
+        if _FAIL_RE.search(body):
             return 500  # Server error
 
         return 200  # Success
@@ -46,7 +58,7 @@ class SmsGatewaySDK:
         if len(text) == 0:
             return {"ok": False, "error": "empty_message"}
 
-        if "fail" in text.lower():
+        if _FAIL_RE.search(text):
             return {"ok": False, "error": "gateway_failure"}
 
         return {"ok": True}
@@ -69,6 +81,8 @@ service.notify("user@example.com", "Welcome!")
 
 # Adapters
 class EmailNotifierAdapter(INotifier):
+    __slots__ = ("notifier",)
+
     def __init__(self,notifier:LegacyEmailSDK):
         self.notifier = notifier
     
@@ -80,6 +94,8 @@ class EmailNotifierAdapter(INotifier):
 
 
 class SmsNotifierAdapter(INotifier):
+    __slots__ = ("notifier",)
+
     def __init__(self,notifier:SmsGatewaySDK):
         self.notifier = notifier
     
@@ -99,36 +115,89 @@ class SmsNotifierAdapter(INotifier):
 
 # Better to remove redundancies
 class NotifierDecorator(INotifier):
+    __slots__ = ("notifier", "_send")
+
     def __init__(self, notifier: INotifier):
         self.notifier = notifier
+        # Bound once here so each send skips the attribute lookup on the wrapped notifier
+        self._send = notifier.send
 
 
-class LoggingDecorator(INotifierDecorator):
-    
+class LoggingDecorator(NotifierDecorator):
+    __slots__ = ()
+
     def send(self, recipient: str, message: str) -> bool:
         print("Recipient:", recipient)
         print("Message:", message)
-        return self.notifier.send(recipient, message)
+        return self._send(recipient, message)
 
 
 class RetryDecorator(NotifierDecorator):
+    __slots__ = ("retry_count",)
+
     def __init__(self, notifier: INotifier, retry_count: int = 5):
         super().__init__(notifier)
         self.retry_count = retry_count
 
     def send(self, recipient: str, message: str) -> bool:
         for _ in range(self.retry_count):
-            if self.notifier.send(recipient, message):
+            if self._send(recipient, message):
                 return True
         return False
 
 
-class ExecutionTimeDecorator(INotifierDecorator):
-    
+# Starts one attempt, then another each time hedge_delay passes (or an attempt
+# fails) without a success, up to retry_count attempts; returns on the first success.
+# Attempts already running when one succeeds still complete, so a slow backend can
+# receive more than one delivery: only wrap idempotent notifiers.
+# Each decorator owns its pool, so stacked hedged decorators never wait on a
+# pool whose workers are themselves waiting.
+class HedgedRetryDecorator(NotifierDecorator):
+    __slots__ = ("retry_count", "hedge_delay", "_executor")
+
+    def __init__(self, notifier: INotifier, retry_count: int = 5, hedge_delay: float = 0.5):
+        super().__init__(notifier)
+        self.retry_count = retry_count
+        self.hedge_delay = hedge_delay
+        self._executor = ThreadPoolExecutor(max_workers=max(retry_count, 1))
+
+    def send(self, recipient: str, message: str) -> bool:
+        if self.retry_count == 1:
+            return self._send(recipient, message)
+        running = set()
+        submitted = 0
+        error = None
+        try:
+            while submitted < self.retry_count or running:
+                if submitted < self.retry_count:
+                    running.add(self._executor.submit(self._send, recipient, message))
+                    submitted += 1
+                    timeout = self.hedge_delay
+                else:
+                    timeout = None
+                done, running = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # An attempt that raised counts as a failed attempt
+                    if future.exception() is not None:
+                        error = future.exception()
+                    elif future.result():
+                        return True
+            # No attempt succeeded; surface the error if any attempt raised
+            if error is not None:
+                raise error
+            return False
+        finally:
+            for future in running:
+                future.cancel()
+
+
+class ExecutionTimeDecorator(NotifierDecorator):
+    __slots__ = ()
+
     def send(self, recipient: str, message: str) -> bool:
         start = time.perf_counter()
         try:
-            return self.notifier.send(recipient, message)
+            return self._send(recipient, message)
         finally:
             end = time.perf_counter()
             print(f"Execution Time: {end - start:.4f}s")
@@ -0,0 +1,43 @@
+import contextlib
+import importlib.util
+import io
+import os
+import threading
+import time
+import unittest
+
+_spec = importlib.util.spec_from_file_location(
+    "solution", os.path.join(os.path.dirname(__file__), "solution.py")
+)
+solution = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(solution)
+
+
+class SlowFailingNotifier(solution.INotifier):
+    def send(self, recipient: str, message: str) -> bool:
+        time.sleep(0.05)
+        return False
+
+
+class HedgedRetryDecoratorTest(unittest.TestCase):
+
+    def test_nested_concurrent_stack_finishes(self):
+        notifier = solution.HedgedRetryDecorator(
+            solution.HedgedRetryDecorator(SlowFailingNotifier(), 3, 0.05), 3, 0.05
+        )
+        service = solution.NotificationService(notifier)
+        results = []
+
+        def run():
+            results.extend(service.notify_many([("a", "b")] * 4))
+
+        worker = threading.Thread(target=run, daemon=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            worker.start()
+            worker.join(timeout=10)
+        self.assertFalse(worker.is_alive(), "nested hedged sends deadlocked")
+        self.assertEqual(results, [False] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()